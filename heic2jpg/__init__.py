@@ -0,0 +1,3 @@
+from heic2jpg.core import convert_heic_to_jpg, convert_single_file, find_heic_files, main
+
+__all__ = ["convert_heic_to_jpg", "convert_single_file", "find_heic_files", "main"]
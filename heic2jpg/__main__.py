@@ -0,0 +1,4 @@
+from heic2jpg.core import main
+
+if __name__ == "__main__":
+    main()